@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+A developer utility to regenerate the color-blind simulation PNG tables
+in the images folder from the full-color table screenshot. Not needed to
+run the main programs; use it only after images/full_color_start.png has
+been updated (e.g., for a new font or table layout).
+   Usage: $ python3 generate_simtables.py
+Each simulation applies the same T matrix used at runtime by
+tk_color_helper.py, from tk_utils.constants.SIM_MATRICES, so the
+pre-rendered tables and live simulated colors stay in agreement.
+Requires the third-party packages numpy and Pillow:
+   $ pip install numpy Pillow
+"""
+# 'Copyright (C) 2021- 2024 C.S. Echt, under GNU General Public License'
+
+import sys
+
+try:
+    import numpy as np
+    from PIL import Image
+except (ImportError, ModuleNotFoundError) as import_err:
+    print('This utility requires the numpy and Pillow packages.\n'
+          'Install them with: pip install numpy Pillow\n'
+          f'Error message: {import_err}')
+    sys.exit(1)
+
+# Local program import
+from tk_utils import constants as const, utils
+
+SOURCE_IMAGE = 'images/full_color_start.png'
+
+
+def build_sim_png(sim_type: str) -> None:
+    """
+    Apply the *sim_type* T matrix to every pixel of the full-color
+    table image and save the result as the simulation table PNG.
+    The whole image is converted in one vectorized matrix product
+    rather than a per-pixel Python loop.
+
+    :param sim_type: 'deuteranopia', 'protanopia', 'tritanopia',
+                     'grayscale'; a key of const.SIM_MATRICES.
+    """
+    t_matrix = np.array(const.SIM_MATRICES[sim_type])
+    rgb = np.asarray(
+        Image.open(utils.valid_path_to(SOURCE_IMAGE)).convert('RGB'))
+
+    # (H, W, 3) @ T-transpose applies the matrix to each pixel's RGB.
+    sim = np.clip((rgb @ t_matrix.T).round(), 0, 255).astype(np.uint8)
+
+    out_path = utils.valid_path_to(f'images/{sim_type}_colortable.png')
+    Image.fromarray(sim).save(out_path)
+    print(f'Saved {out_path}')
+
+
+def main():
+    """
+    Regenerate all four simulation table PNG files.
+    """
+    for sim_type in const.SIM_MATRICES:
+        build_sim_png(sim_type)
+
+
+if __name__ == "__main__":
+    main()
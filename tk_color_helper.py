@@ -25,10 +25,12 @@ https://stackoverflow.com/questions/4969543/colour-chart-for-tkinter-and-tix
 # 'Copyright (C) 2021- 2024 C.S. Echt, under GNU General Public License'
 
 # Standard imports
+from functools import lru_cache, partial
 from signal import signal, SIGINT
 
 try:
     import tkinter as tk
+    from tkinter import font as tk_font
 except (ImportError, ModuleNotFoundError):
     print('Requires tkinter, which is included with \n'
           'Python 3.7+ distributions.\n'
@@ -42,6 +44,76 @@ from tk_utils import (constants as const,
                       vcheck)
 PROGRAM_NAME = utils.program_name()
 
+# Proper set membership for platform and default-foreground tests;
+#   substring tests like "in 'lin, win'" would also match color names
+#   such as 'linen'.
+_LIN_WIN = frozenset(('lin', 'win'))
+_BLACK_WHITE = frozenset(('black', 'white'))
+
+# Perceived-brightness lookup tables for black_or_white(), one weighted
+#   squared term per possible 8-bit channel value. Comparing their sum
+#   to the squared cutoff avoids all float powers and sqrt per call.
+_PB_RED = tuple(0.241 * _c * _c for _c in range(256))
+_PB_GREEN = tuple(0.691 * _c * _c for _c in range(256))
+_PB_BLUE = tuple(0.068 * _c * _c for _c in range(256))
+_PB_CUTOFF = 138 ** 2
+
+
+@lru_cache(maxsize=None)
+def rgb_to_hex(rgb: tuple) -> str:
+    """
+    Convert 8-bit RGB integers to a hex color string that tkinter
+    recognizes. Memoized because users click the same small palette of
+    colors repeatedly.
+
+    :param rgb: (R, G, B) tuple of integers in range(0-255)
+
+    :returns: Hex color string, e.g. '#ff8800'.
+    """
+    _r, _g, _b = rgb
+    return f'#{_r:02x}{_g:02x}{_b:02x}'
+
+
+@lru_cache(maxsize=None)
+def simulate_rgb(rgb: tuple, sim_type: str) -> tuple:
+    """
+    Convert 8-bit RGB values to those seen with the given type of color
+    blindness, or to grayscale, using T matrix RGB conversion. The T
+    matrices live in const.SIM_MATRICES, shared with the
+    generate_simtables.py utility. Results are memoized and the cache is
+    warmed for the whole palette at startup, so simulating any table
+    color is a lookup instead of fresh matrix math.
+
+    :param rgb: (R, G, B) tuple of integers in range(0-255)
+    :param sim_type: 'deuteranopia', 'protanopia', 'tritanopia',
+                     'grayscale'; any other value passes *rgb* through.
+
+    :returns: (R, G, B) tuple of simulated values in range(0-255)
+    """
+    t_matrix = const.SIM_MATRICES.get(sim_type)
+    if t_matrix is None:
+        # 'nosim', or an unrecognized type, passes RGB through unchanged.
+        return rgb
+    _r, _g, _b = rgb
+
+    if sim_type == 'grayscale':
+        # All three grayscale matrix rows are identical, so compute the
+        #   luma once; weighted 8-bit input cannot leave range(0-256),
+        #   so no clip is needed. Float weights are kept because integer
+        #   fixed-point shifts the rounded value for some inputs.
+        _w1, _w2, _w3 = t_matrix[0]
+        _y = round(_w1 * _r + _w2 * _g + _w3 * _b)
+        return _y, _y, _y
+
+    # Need to restrict RGB values to integers in range (0 - 255).
+    # source: https://stackoverflow.com/questions/5996881/
+    #   how-to-limit-a-number-to-be-within-a-specified-range-python
+    def clip(_c):
+        return max(min(255, _c), 0)
+
+    return tuple(clip(round(_w1 * _r + _w2 * _g + _w3 * _b))
+                 for _w1, _w2, _w3 in t_matrix)
+
 
 class ColorChart(tk.Tk):
     """
@@ -52,88 +124,239 @@ class ColorChart(tk.Tk):
     """
 
     # __slots__ = (
-    #     'use_info', 'bg_info', 'fg_info', 'bg_text', 'fg_text', 'bg_hex',
+    #     'use_info', 'bg_info', 'fg_info', 'bg_text', 'fg_text',
     #     'fg_color', 'fg_hex', 'fg_rgb', 'sim_type', 'info_width'
     # )
 
+    # Simulation table image paths and window titles, resolved once at
+    #   class definition so show_simtable() does no path work per press.
+    SIM_TABLES = {
+        'd': (utils.valid_path_to('images/deuteranopia_colortable.png'),
+              'X11 named colors with deuteranopia simulation'),
+        'p': (utils.valid_path_to('images/protanopia_colortable.png'),
+              'X11 named colors with protanopia simulation'),
+        't': (utils.valid_path_to('images/tritanopia_colortable.png'),
+              'X11 named colors with tritanopia simulation'),
+        'g': (utils.valid_path_to('images/grayscale_colortable.png'),
+              'X11 named colors with grayscale simulation')
+    }
+
+    # Cache of simulation table PhotoImage objects, filled on first use
+    #   in show_simtable().
+    _sim_images: dict = {}
+
     def __init__(self):
         super().__init__()
 
+        # Shared Font objects; Tk parses each font description once
+        #   instead of re-parsing it for every widget that uses it.
+        self.label_font = tk_font.Font(root=self, font=const.LABEL_FONT)
+        self.info_font = tk_font.Font(root=self, font=const.INFO_FONT)
+
         self.use_info = tk.Label(self)
         self.bg_info = tk.Entry(self)
         self.fg_info = tk.Entry(self)
+
+        # Cached Tcl path names for the raw tk.call updates in
+        #   set_info_colors().
+        self.bg_info_path = str(self.bg_info)
+        self.fg_info_path = str(self.fg_info)
         self.bg_text = tk.StringVar()
         self.fg_text = tk.StringVar()
-        self.bg_hex = tk.StringVar()
-        self.fg_color = tk.StringVar()
-        self.fg_hex = tk.StringVar()
+
+        # Plain attributes; these are never bound to a widget
+        #   textvariable, so StringVars would only add Tcl round-trips.
+        self.fg_color = ''
+        self.fg_hex = ''
         self.fg_rgb: tuple = ()
-        self.sim_type = tk.StringVar()
+        self.sim_type = 'nosim'
+
+        # Tracks which simulation the displayed foreground was run
+        #   through; compared against sim_type in sync_simtypes().
+        self.fg_sim_type = 'nosim'
+
+        # True while an info-field select_clear is waiting on after_idle;
+        #   set in schedule_select_clear().
+        self.sel_clear_pending = False
+
+        # Map each color Label to its (color_name, rgb, color_hex) record
+        #   so one bound handler per event type serves all 760 labels.
+        self.label_records = {}
 
         # Width of row1; total number of columns to be gridded in make_colortable().
         self.info_width = 0
 
     def make_colortable(self) -> None:
         """
-        Make the tkinter color table.
+        Make the tkinter color table. Labels are created and gridded in
+        batches scheduled through after_idle() so the main window can
+        paint and respond while the table fills in.
+        Call fill_colortable(), which in turn calls black_or_white().
+        """
+
+        # The column count is fixed by the color count and row limit, so
+        #   set it up front for config_master() to grid the info widgets
+        #   before the table has finished filling in.
+        rows_per_column = const.MAX_ROWS - 2
+        self.info_width = -(-len(const.X11_RGB_NAMES) // rows_per_column)
+
+        filler = self.fill_colortable()
+        self.after_idle(self.fill_chunk, filler)
+
+    def all_winfo_rgb(self) -> dict:
+        """
+        Resolve every color in const.X11_RGB_NAMES to an 8-bit (R, G, B)
+        tuple with a single Tcl round-trip, instead of a winfo_rgb call
+        per color. Values are identical to label.winfo_rgb(); Tk stays
+        the single source of truth for what each name means.
+        Called from fill_colortable().
+
+        :returns: Dictionary of {color_name: (R, G, B)} for all colors.
+        """
+        script = ' '.join(
+            f'[winfo rgb {self} {{{name}}}]' for name in const.X11_RGB_NAMES)
+
+        # Convert winfo rgb 16-bit values (in range 0-65535) to 8-bit.
+        values = tuple(
+            int(v) >> 8 for v in self.tk.eval(f'concat {script}').split())
+        return {name: values[i * 3: i * 3 + 3]
+                for i, name in enumerate(const.X11_RGB_NAMES)}
+
+    def fill_chunk(self, filler) -> None:
+        """
+        Advance the color table builder by one batch of labels, then
+        reschedule itself until the table is complete.
+        Called from make_colortable().
+
+        :param filler: The running fill_colortable() generator.
+        """
+        try:
+            next(filler)
+        except StopIteration:
+            return
+        self.after_idle(self.fill_chunk, filler)
+
+    def fill_colortable(self):
+        """
+        A generator that creates, binds, and grids all the color table
+        Labels, yielding control back to the mainloop after each batch
+        so the window stays responsive during startup.
         Call simulate_color(), black_or_white(), foreground_info.
         """
 
-        # Row 0 reserved for standing usage instructions, row 1 reserved
-        #  for color information Entry() fields, so begin at row 2.
-        _col = 0
-        _row = 2
+        chunk_size = 50
         labels = []
 
-        # Bindings for mouse events and simulated color display.
-        event_simulations = (
-            ('<Button-1>', 'nosim'),
-            ('<Shift-Button-1>', 'deuteranopia'),
-            ('<Control-Button-1>', 'protanopia'),
-            ('<Shift-Control-Button-1>', 'grayscale'),
-            ('<Alt-Button-1>' if utils.MY_OS in 'lin, win' else '<Command-Button-1>',
-             'tritanopia')
-        )
-
-        for color_name in const.X11_RGB_NAMES:
+        # Bind loop invariants to locals; for 760 iterations the repeated
+        #   attribute lookups add up.
+        label_font = self.label_font
+        label_records = self.label_records
+        black_or_white = self.black_or_white
+        sim_types = tuple(const.SIM_MATRICES)
+
+        # One batched Tcl call replaces 760 winfo_rgb round-trips.
+        rgb_values = self.all_winfo_rgb()
+
+        # Grid positions are precomputed in constants, so no row or
+        #   column bookkeeping is needed here.
+        for color_name, _row, _col in const.X11_RGB_GRID:
+            rgb = rgb_values[color_name]
+            color_hex = rgb_to_hex(rgb)
+
+            # Set default label text B&W fg for best contrast against
+            #   color_name bg; passing fg to the constructor avoids a
+            #   second configure call per label.
             label = tk.Label(self,
                              text=color_name,
                              bg=color_name,
-                             font=const.LABEL_FONT,
+                             fg=black_or_white(rgb),
+                             font=label_font,
                              )
             labels.append((label, _row, _col))
-            _row += 1
+            label_records[label] = (color_name, rgb, color_hex)
+
+            # Warm the simulation, contrast, and hex caches so a first
+            #   modifier-click on any table color is all lookups instead
+            #   of fresh matrix, brightness, and string work.
+            for sim in sim_types:
+                sim_rgb = simulate_rgb(rgb, sim)
+                black_or_white(sim_rgb)
+                rgb_to_hex(sim_rgb)
+
+            # Prepend the shared bindtag; the class-level bindings from
+            #   bind_swatch_events() then cover every color label.
+            label.bindtags(('ColorSwatch',) + label.bindtags())
+
+            # Grid the finished batch, then hand control back to the
+            #   mainloop so pending events and redraws can run.
+            if len(labels) >= chunk_size:
+                self.grid_labels(labels)
+                labels.clear()
+                yield
+
+        # Grid any remainder labels after the loop.
+        self.grid_labels(labels)
+
+    def grid_labels(self, labels: list) -> None:
+        """
+        Grid a batch of color labels with a single Tcl script instead of
+        a .grid() round-trip per label.
+        Called from fill_colortable().
 
-            # Convert winfo_rgb 16-bit RGB tuple (in range 0-65535) to 8-bit values.
-            _R, _G, _B = [x >> 8 for x in label.winfo_rgb(color_name)]
-            rgb = (_R, _G, _B)
-            color_hex = f'#{_R:02x}{_G:02x}{_B:02x}'
+        :param labels: List of (label, row, column) tuples to grid.
+        """
+        if labels:
+            self.tk.eval('\n'.join(
+                f'grid configure {label} -row {row} -column {col} -sticky nsew'
+                for label, row, col in labels))
 
-            # Set default label text B&W fg for best contrast against color_name bg.
-            label.config(fg=self.black_or_white(rgb))
+    def bind_swatch_events(self) -> None:
+        """
+        Install one class-level binding per mouse event on the shared
+        'ColorSwatch' bindtag carried by every color label, instead of
+        six bind() calls on each of the 760 labels.
+        Called from config_master().
+        """
+        event_simulations = (
+            ('<Button-1>', 'nosim'),
+            ('<Shift-Button-1>', 'deuteranopia'),
+            ('<Control-Button-1>', 'protanopia'),
+            ('<Shift-Control-Button-1>', 'grayscale'),
+            ('<Alt-Button-1>' if utils.MY_OS in _LIN_WIN else '<Command-Button-1>',
+             'tritanopia')
+        )
+        for event, sim in event_simulations:
+            self.bind_class('ColorSwatch', event,
+                            partial(self.on_sim_click, sim_type=sim))
 
-            for event, sim in event_simulations:
-                label.bind(event,
-                           lambda _, c=color_name, r_b=rgb, s=sim:
-                                self.simulate_color(color=c, rgb=r_b, sim_type=s),
-                           )
+        self.bind_class(
+            'ColorSwatch',
+            '<Button-3>' if utils.MY_OS in _LIN_WIN else '<Button-2>',
+            self.on_fg_click)
 
-            label.bind(
-                '<Button-3>' if utils.MY_OS in 'lin, win' else '<Button-2>',
-                lambda _, c=color_name, h=color_hex, r_b=rgb:
-                    self.foreground_info(color=c, rgb=r_b, fg_hex=h)
-            )
+    def on_sim_click(self, event, sim_type: str) -> None:
+        """
+        Show the clicked color, simulated for *sim_type*, as background.
+        One shared handler for all color labels; bound, per simulation
+        type, in bind_swatch_events().
 
-            if _row >= const.MAX_ROWS:
-                _col += 1
-                _row = 2  # The row index to start the next column.
+        :param event: The mouse click event on a color label.
+        :param sim_type: 'deuteranopia', 'protanopia',
+                         'tritanopia', 'grayscale', 'nosim'
+        """
+        color_name, rgb, _ = self.label_records[event.widget]
+        self.simulate_color(color=color_name, rgb=rgb, sim_type=sim_type)
 
-        # Grid all labels after the loop
-        for label, row, col in labels:
-            label.grid(row=row, column=col, sticky=tk.NSEW)
+    def on_fg_click(self, event) -> None:
+        """
+        Apply the clicked color as the foreground of the info fields.
+        One shared handler for all color labels; bound to right-click
+        in bind_swatch_events().
 
-        # Used in config_master()
-        self.info_width = _col
+        :param event: The mouse click event on a color label.
+        """
+        color_name, rgb, color_hex = self.label_records[event.widget]
+        self.foreground_info(color=color_name, rgb=rgb, fg_hex=color_hex)
 
     def config_master(self) -> None:
         """
@@ -152,10 +375,15 @@ class ColorChart(tk.Tk):
                     )
 
         # Set up grid weights for resizing with the main window.
-        for _row in range(const.MAX_ROWS):
-            self.rowconfigure(_row, weight=1)
-        for _col in range(self.info_width):
-            self.columnconfigure(_col, weight=1)
+        # One Tcl script avoids a Python-to-Tcl round-trip per row/column.
+        self.tk.eval('\n'.join(
+            [f'grid rowconfigure {self} {_row} -weight 1'
+             for _row in range(const.MAX_ROWS)] +
+            [f'grid columnconfigure {self} {_col} -weight 1'
+             for _col in range(self.info_width)]))
+
+        # One set of class-level bindings serves all color labels.
+        self.bind_swatch_events()
 
         # Provide an exit msg in Terminal when click on the close window icon.
         self.protocol('WM_DELETE_WINDOW', lambda: utils.quit_gui(self))
@@ -173,16 +401,13 @@ class ColorChart(tk.Tk):
 
         # Keybindings to show the simulated color table images in Toplevel
         #  windows for deuteranopia, protanopia, tritanopia, & grayscale.
-        cmdkey = 'Control' if utils.MY_OS in ('lin', 'win') else 'Command'
+        cmdkey = 'Control' if utils.MY_OS in _LIN_WIN else 'Command'
         for sim in ('d', 'p', 't', 'g'):
             self.bind(f'<{cmdkey}-{sim}>', lambda _, s=sim: self.show_simtable(s))
 
-        utils.click('right', self.bg_info)
-        utils.click('right', self.fg_info)
-
-        self.use_info.configure(font=const.INFO_FONT)
-        self.bg_info.config(font=const.INFO_FONT)
-        self.fg_info.config(font=const.INFO_FONT)
+        self.use_info.configure(font=self.info_font)
+        self.bg_info.config(font=self.info_font)
+        self.fg_info.config(font=self.info_font)
 
         # This usage information goes on the top row and is always visible.
         usage = ('Click changes background, right-click changes foreground.'
@@ -228,9 +453,6 @@ class ColorChart(tk.Tk):
                           sticky=tk.NSEW,
                           )
 
-        # Need 'nosim' as default start value.
-        self.sim_type.set('nosim')
-
         # It's all set up, so now display all widgets in the main window.
         self.grid()
 
@@ -253,44 +475,13 @@ class ColorChart(tk.Tk):
         :returns: (sim_hex: str, sim_rgb: tuple)
         """
 
-        self.sim_type.set(sim_type)
-        _r, _g, _b = rgb
-        _R = 0
-        _G = 0
-        _B = 0
-
-        # Need to restrict RGB values to integers in range (0 - 255).
-        # source: https://stackoverflow.com/questions/5996881/
-        #   how-to-limit-a-number-to-be-within-a-specified-range-python
-        def clip(_c):
-            return max(min(255, _c), 0)
-
-        # Calculate color-blind simulation using T matrix RGB conversion.
-        # All T matrix values from http://mkweb.bcgsc.ca/colorblind/math.mhtml
-        #   and are conversion summaries with the LMSD65 XYZ-LMS conversion matrix.
-        #   Author: Martin Krzywinski
-        sim_types = {
-            'deuteranopia': (clip(round((0.33066007 * _r) + (0.66933993 * _g))),
-                             clip(round((0.33066007 * _r) + (0.66933993 * _g))),
-                             clip(round((-0.02785538 * _r) + (0.02785538 * _g) + (1 * _b)))),
-            'protanopia': (clip(round((0.170556992 * _r) + (0.829443014 * _g))),
-                           clip(round((0.170556991 * _r) + (0.829443008 * _g))),
-                           clip(round((-0.004517144 * _r) + (0.004517144 * _g) + (1 * _b)))),
-            'tritanopia': (clip(round((1 * _r) + (0.1273989 * _g) + (-0.1273989 * _b))),
-                           clip(round((0 * _r) + (0.8739093 * _g) + (0.1260907 * _b))),
-                           clip(round((0 * _r) + (0.8739093 * _g) + (0.1260907 * _b)))),
-            'grayscale': (int(round((.2126 * _r) + (.7152 * _g) + (.0722 * _b), 0)),
-                          int(round((.2126 * _r) + (.7152 * _g) + (.0722 * _b), 0)),
-                          int(round((.2126 * _r) + (.7152 * _g) + (.0722 * _b), 0))),
-            'nosim': (_r, _g, _b)
-        }
-
-        _R, _G, _B = sim_types.get(sim_type, (_r, _g, _b))
-        sim_hex = f'#{_R:02x}{_G:02x}{_B:02x}'
-        sim_rgb = (_R, _G, _B)
+        self.sim_type = sim_type
+
+        sim_rgb = simulate_rgb(rgb, sim_type)
+        sim_hex = rgb_to_hex(sim_rgb)
 
         # Need to distinguish whether sim is for default fg, new bg, or new fg.
-        prior_fg = self.fg_hex.get()
+        prior_fg = self.fg_hex
         fg_hex = self.black_or_white(sim_rgb)
 
         # 'fg_do is None' is true when call is from button1 click.
@@ -298,15 +489,18 @@ class ColorChart(tk.Tk):
         #     color label's black or white.
         if sim_type == 'nosim' and fg_do is None:
             # Note: here, fg_hex is the color name, not the hexcode.
-            self.fg_hex.set(prior_fg if prior_fg not in 'black, white' else fg_hex)
+            #   An empty prior_fg means no fg has been selected yet, so
+            #   treat it like the default black or white.
+            self.fg_hex = (
+                prior_fg if prior_fg and prior_fg not in _BLACK_WHITE else fg_hex)
         elif sim_type != 'nosim' and fg_do is None:
-            if prior_fg in 'black, white':
-                self.fg_hex.set(fg_hex)
-                self.fg_color.set(fg_hex)
+            if not prior_fg or prior_fg in _BLACK_WHITE:
+                self.fg_hex = fg_hex
+                self.fg_color = fg_hex
 
         # 'fg_do is yes' when call is from button2 or 3, via foreground_info().
         if fg_do == 'yes':
-            self.fg_hex.set(sim_hex)
+            self.fg_hex = sim_hex
         else:  # is None by default
             self.display_colors(color, sim_rgb, sim_type)
 
@@ -331,13 +525,12 @@ class ColorChart(tk.Tk):
         Returns: None
         """
 
-        _r, _g, _b = rgb
-        bg_hex = f'#{_r:02x}{_g:02x}{_b:02x}'
+        bg_hex = rgb_to_hex(rgb)
 
-        self.sim_type.set(sim_type)
+        self.sim_type = sim_type
         # self.fg_hex is first set in simulate_color(). It will be the
         #   default 'black' or 'white' until rt-click binding changes the fg.
-        fg_hex = self.fg_hex.get()
+        fg_hex = self.fg_hex
 
         # Click binding sends color selection to simulate_color(),
         #   with a sim_type tag.
@@ -347,15 +540,55 @@ class ColorChart(tk.Tk):
         else:
             self.bg_text.set(
                 f"{sim_type} sees '{color}' as bg='{bg_hex}'; RGB {rgb}")
-        self.bg_info.configure(bg=bg_hex, fg=fg_hex)
-        self.fg_info.configure(bg=bg_hex, fg=fg_hex)
+        self.set_info_colors(bg=bg_hex, fg=fg_hex)
 
         self.sync_simtypes()
 
         # Need to clear any previously selected text highlighting.
+        self.schedule_select_clear()
+
+    def schedule_select_clear(self) -> None:
+        """
+        Clear selected text highlighting in both info Entry fields,
+        coalesced through after_idle so that multiple updates within one
+        click event produce a single pair of clears.
+        Called from display_colors() and foreground_info().
+        """
+        if not self.sel_clear_pending:
+            self.sel_clear_pending = True
+            self.after_idle(self.clear_info_selections)
+
+    def clear_info_selections(self) -> None:
+        """
+        Run the select_clear calls queued by schedule_select_clear().
+        """
+        self.sel_clear_pending = False
         self.bg_info.select_clear()
         self.fg_info.select_clear()
 
+    def set_info_colors(self, bg: str = None, fg: str = None) -> None:
+        """
+        Configure both info Entry fields with the same color options.
+        Only the given options are changed, with one configure call per
+        widget.
+        Called from display_colors(), foreground_info(), sync_simtypes().
+
+        :param bg: Optional background color for both Entry fields.
+        :param fg: Optional foreground color for both Entry fields.
+        """
+        options = ()
+        if bg is not None:
+            options += ('-bg', bg)
+        if fg is not None:
+            options += ('-fg', fg)
+        if not options:
+            return
+
+        # Raw tk.call skips tkinter's Python-side option processing;
+        #   these two calls run on every color click.
+        self.tk.call(self.bg_info_path, 'configure', *options)
+        self.tk.call(self.fg_info_path, 'configure', *options)
+
     def foreground_info(self, color: str, rgb: tuple, fg_hex: str) -> None:
         """
         Assign foreground color to Entry() fields. Provide fg data.
@@ -367,18 +600,19 @@ class ColorChart(tk.Tk):
                     simulated color.
         """
         _r, _g, _b = rgb
-        sim_type = self.sim_type.get()
+        sim_type = self.sim_type
 
         # Used in sync_simtypes() to synchronize fg to bg sim_types.
-        self.fg_color.set(color)
+        self.fg_color = color
         self.fg_rgb = rgb
 
+        self.fg_sim_type = sim_type
+
         if sim_type == 'nosim':
-            self.fg_hex.set(fg_hex)
+            self.fg_hex = fg_hex
             self.fg_text.set(
                 f"fg='{color}' or fg='{fg_hex}'; RGB {rgb}")
-            self.bg_info.configure(fg=fg_hex)
-            self.fg_info.configure(fg=fg_hex)
+            self.set_info_colors(fg=fg_hex)
         else:
             # To match fg to bg sim_type, fg selection calls simulate_color(),
             #   which sets the fg sim hex and rgb control variables.
@@ -388,12 +622,10 @@ class ColorChart(tk.Tk):
                                                    fg_do='yes')
             self.fg_text.set(
                 f"{sim_type} sees '{color}' as fg='{sim_hex}'; RGB {sim_rgb}")
-            self.bg_info.configure(fg=sim_hex)
-            self.fg_info.configure(fg=sim_hex)
+            self.set_info_colors(fg=sim_hex)
 
         # Need to clear any previously selected text edit-highlighting.
-        self.bg_info.select_clear()
-        self.fg_info.select_clear()
+        self.schedule_select_clear()
 
     def sync_simtypes(self) -> None:
         """
@@ -402,27 +634,19 @@ class ColorChart(tk.Tk):
         Called from display_colors().
         """
 
-        bg_text = self.bg_text.get()
-        fg_text = self.fg_text.get()
-        sim_type = self.sim_type.get()
-        color = self.fg_color.get()
-        fg_hex = self.fg_hex.get()
+        sim_type = self.sim_type
+        color = self.fg_color
+        fg_hex = self.fg_hex
 
         # Set self.fg_rgb to default color fg of black or white
         # if sim color is selected before a fg color is selected.
         self.fg_rgb = (0, 0, 0) if fg_hex == 'black' else (255, 255, 255) if fg_hex == 'white' else self.fg_rgb
 
-        match = False
-        for sim in ('deuteranopia', 'protanopia', 'tritanopia', 'grayscale', 'nosim'):
-            if sim in bg_text and sim in fg_text:
-                match = True
-
-        # NOTE: 'sees' matches when simulations not used; works ONLY because
-        #  whenever a simulation is run,'sees' is part of the text StringVar
-        #  in display_colors(), foreground_info(), and below.
-        if 'sees' not in bg_text and 'sees' not in fg_text:
-            match = True
-        if not match:
+        # The fg needs re-simulating only when its sim type has fallen
+        #   behind the selected bg sim type; direct comparison replaces
+        #   the former substring scans of the info text.
+        if self.fg_sim_type != sim_type:
+            self.fg_sim_type = sim_type
             sim_hex, sim_rgb = self.simulate_color(color=color,
                                                    rgb=self.fg_rgb,
                                                    sim_type=sim_type,
@@ -433,10 +657,10 @@ class ColorChart(tk.Tk):
             else:
                 self.fg_text.set(
                     f"{sim_type} sees '{color}' as fg='{sim_hex}'; RGB {sim_rgb}")
-            self.bg_info.configure(fg=sim_hex)
-            self.fg_info.configure(fg=sim_hex)
+            self.set_info_colors(fg=sim_hex)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def black_or_white(rgb: tuple) -> str:
         """
         Calculate perceived brightness value of input RGB to determine
@@ -455,9 +679,9 @@ class ColorChart(tk.Tk):
         #   black to white foreground will give acceptable visual contrast when
         #   background below that PB. 130 has a cutoff of gray51.
         # Range of 128-145 will give acceptable results, says author @NirDobovizki.
-        _pb = ((.241 * _R ** 2) + (.691 * _G ** 2) + (.068 * _B ** 2)) ** 0.5
-
-        if _pb > 138:
+        # Squared brightness terms are precomputed in the module _PB lookup
+        #   tables, so the cutoff comparison is also squared.
+        if _PB_RED[_R] + _PB_GREEN[_G] + _PB_BLUE[_B] > _PB_CUTOFF:
             return 'black'
         return 'white'
 
@@ -472,22 +696,16 @@ class ColorChart(tk.Tk):
         :param sim_type: 'd', 'p', 't', 'g'
         :return: None
         """
-        sims = {
-            'd': ('images/deuteranopia_colortable.png',
-                  'X11 named colors with deuteranopia simulation'),
-            'p': ('images/protanopia_colortable.png',
-                  'X11 named colors with protanopia simulation'),
-            't': ('images/tritanopia_colortable.png',
-                  'X11 named colors with tritanopia simulation'),
-            'g': ('images/grayscale_colortable.png',
-                  'X11 named colors with grayscale simulation')
-        }
-
-        img = (tk.PhotoImage(file=utils.valid_path_to(sims[sim_type][0]))
-               if sims[sim_type][0] else tk.PhotoImage())
+        table_path, table_title = self.SIM_TABLES[sim_type]
+
+        # Read and decode each table PNG only once; subsequent calls
+        #   reuse the cached PhotoImage across Toplevel windows.
+        if sim_type not in self._sim_images:
+            self._sim_images[sim_type] = tk.PhotoImage(file=table_path)
+        img = self._sim_images[sim_type]
         simwin = tk.Toplevel()
         simwin.minsize(1200, 580)
-        simwin.title(sims[sim_type][1])
+        simwin.title(table_title)
         simwin.image = img
         simtable = tk.Text(simwin)
         simtable.image_create(tk.END, image=img)
@@ -2,7 +2,7 @@
 Constants used in main script and in other tk_utils modules.
 """
 # Standard library import:
-from sys import platform
+from sys import intern, platform
 
 #  Supported OS platforms: 'win', 'lin', 'dar'.
 MY_OS = platform[:3]
@@ -12,22 +12,35 @@ MY_OS = platform[:3]
 #  Color names are in X11_RGB_NAMES.
 MAX_ROWS = 42
 
-# OS-specific font sizes for color names in table.
-LABEL_FONT_MAP = {
-    'dar': ('SF Pro', 9),  # macOS
-    'lin': ('DejaVu Sans', 6),  # Linux (Ubuntu)
-    'win': ('Segoe UI', 8)  # Windows (10, 11)
-}
-
-# Defaults to generic font if OS is not recognized
-LABEL_FONT = LABEL_FONT_MAP.get(MY_OS, ('Arial', 10))
+# OS-specific fonts as (label font, info font) pairs, resolved with a
+#   single MY_OS lookup; defaults to generic fonts if OS is not recognized.
+LABEL_FONT, INFO_FONT = {
+    'dar': (('SF Pro', 9), ('SF Pro', 12)),  # macOS
+    'lin': (('DejaVu Sans', 6), ('DejaVu Sans', 10)),  # Linux (Ubuntu)
+    'win': (('Segoe UI', 8), ('Segoe UI', 10))  # Windows (10, 11)
+}.get(MY_OS, (('Arial', 10), ('Arial', 12)))
 
-INFO_FONT_MAP = {
-    'dar': ('SF Pro', 12),  # macOS
-    'lin': ('DejaVu Sans', 10),  # Linux (Ubuntu)
-    'win': ('Segoe UI', 10)  # Windows (10, 11)
+# Color-blind simulation T matrices, as (3 x 3) row tuples applied to an
+#   (R, G, B) column. Values from http://mkweb.bcgsc.ca/colorblind/math.mhtml
+#   and are conversion summaries with the LMSD65 XYZ-LMS conversion matrix.
+#   Author: Martin Krzywinski.
+# Grayscale rows are the ITU-R BT.709 luma weights.
+# Single source of truth for runtime simulation in tk_color_helper and
+#   for offline regeneration of the images/*_colortable.png assets.
+SIM_MATRICES = {
+    'deuteranopia': ((0.33066007, 0.66933993, 0),
+                     (0.33066007, 0.66933993, 0),
+                     (-0.02785538, 0.02785538, 1)),
+    'protanopia': ((0.170556992, 0.829443014, 0),
+                   (0.170556991, 0.829443008, 0),
+                   (-0.004517144, 0.004517144, 1)),
+    'tritanopia': ((1, 0.1273989, -0.1273989),
+                   (0, 0.8739093, 0.1260907),
+                   (0, 0.8739093, 0.1260907)),
+    'grayscale': ((0.2126, 0.7152, 0.0722),
+                  (0.2126, 0.7152, 0.0722),
+                  (0.2126, 0.7152, 0.0722)),
 }
-INFO_FONT = INFO_FONT_MAP.get(MY_OS, ('Arial', 12))
 
 # X11_RGB_NAMES: 760 color names from the intersection of the rbg.txt files in
 #   Linux /usr/share/X11/rgb.txt and macOS /opt/X11/share/X11/rgb.txt.
@@ -179,3 +192,19 @@ X11_RGB_NAMES = ('white', 'black', 'snow', 'ghost white', 'GhostWhite', 'white s
                  'gray92', 'grey92', 'gray93', 'grey93', 'gray94', 'grey94', 'gray95',
                  'grey95', 'gray96', 'grey96', 'gray97', 'grey97', 'gray98', 'grey98',
                  'gray99', 'grey99', 'gray100', 'grey100')
+
+# Intern the names so the dict and set lookups keyed on them hash each
+#   string once and can short-circuit equality checks on identity.
+X11_RGB_NAMES = tuple(map(intern, X11_RGB_NAMES))
+
+# Companion set for O(1) name-validation lookups; the tuple above keeps
+#   the ordered iteration used to lay out the 19 x 40 table.
+X11_RGB_NAMES_SET = frozenset(X11_RGB_NAMES)
+
+# Precomputed (name, row, column) grid positions for the color table.
+#   Names fill top to bottom, column by column; main window rows 0 and 1
+#   are reserved for the info widgets, so color rows run 2..MAX_ROWS-1.
+_TABLE_ROWS = MAX_ROWS - 2
+X11_RGB_GRID = tuple(
+    (_name, 2 + _i % _TABLE_ROWS, _i // _TABLE_ROWS)
+    for _i, _name in enumerate(X11_RGB_NAMES))
@@ -9,6 +9,7 @@ Functions:
     handle_exceptions - Catches uncaught system and tkinter exceptions.
     quit_gui - Error-free and informative exit from the program.
     position_wrt_window - Get screen position of a window; apply offsets.
+    debounce - Coalesce bursts of repeated callbacks into one run.
     click - Mouse button bindings for a named object.
     get_toplevel - Identify a parent tk window when it, or its child,
                     has focus.
@@ -18,13 +19,11 @@ Functions:
 # 'Copyright (C) 2021- 2022 C.S. Echt, under GNU General Public License'
 
 # Standard library imports:
-import argparse
 import logging
-import platform
 import sys
 import tkinter as tk
 from __main__ import __doc__
-from pathlib import Path
+from functools import lru_cache
 
 # Local program import:
 from tk_utils import (__author__,
@@ -35,9 +34,24 @@ from tk_utils import (__author__,
                       LICENSE)
 from tk_utils.constants import MY_OS
 
+_SUPPORTED_OS = frozenset(('lin', 'win', 'dar'))
+
+# Windows-only dependencies for the DPI-awareness calls in
+#   check_platform(); other platforms never pay for either import.
+if MY_OS == 'win':
+    import platform
+    from ctypes import windll
+
+# The OS-specific keyboard modifier and the bind sequences built from
+#   it; resolved once at import instead of on every keybind() call.
+_CMD_KEY = 'Command' if MY_OS == 'dar' else 'Control'  # is 'lin' or 'win'
+_CLOSE_SEQUENCE = f'<{_CMD_KEY}-w>'
+_QUIT_SEQUENCE = f'<{_CMD_KEY}-q>'
+
+# The right mouse button is button 2 on macOS, button 3 elsewhere.
+_RIGHT_CLICK_BUTTON = '<Button-2>' if MY_OS == 'dar' else '<Button-3>'
+
 logger = logging.getLogger(__name__)
-handler = logging.StreamHandler(stream=sys.stdout)
-logger.addHandler(handler)
 
 
 def handle_exception(exc_type, exc_value, exc_traceback) -> None:
@@ -64,42 +78,64 @@ def handle_exception(exc_type, exc_value, exc_traceback) -> None:
     Returns: None
 
     """
-    if issubclass(exc_type, KeyboardInterrupt):
+    # The identity check settles the common case with one pointer
+    #   compare; issubclass only runs for actual subclasses.
+    if exc_type is KeyboardInterrupt or issubclass(exc_type, KeyboardInterrupt):
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
         return
 
+    # Install the stdout handler on first use rather than at import;
+    #   re-imports (reload, test runners) would otherwise stack
+    #   duplicate handlers and double-print every logged line.
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler(stream=sys.stdout))
+
     logger.error("Uncaught exception",
                  exc_info=(exc_type, exc_value, exc_traceback))
 
 
-def check_platform():
-    if MY_OS not in 'lin, win, dar':
+@lru_cache(maxsize=1)
+def check_platform() -> None:
+    """
+    Exit the program if the OS platform is not supported; on Windows,
+    set process DPI awareness for proper scaling. Cached so the ctypes
+    attribute walk and the DPI-awareness syscall run exactly once, no
+    matter how many startup paths call this.
+    """
+    if MY_OS not in _SUPPORTED_OS:
         print(f'Platform <{sys.platform}> is not supported.\n'
               'Windows, Linux, and MacOS (darwin) are supported.')
         sys.exit(1)
 
     # Need to account for scaling in Windows10 and earlier releases.
     if MY_OS == 'win':
-        from ctypes import windll
-
         if platform.release() < '10':
             windll.user32.SetProcessDPIAware()
         else:
             windll.shcore.SetProcessDpiAwareness(1)
 
 
+@lru_cache(maxsize=1)
 def program_name() -> str:
     """
     Returns the script name or, if called from a PyInstaller stand-alone,
     the executable name. Use for setting file paths and naming windows.
+    The name is fixed for the life of the process, so it is cached
+    after the first Path parse.
 
     :return: Context-specific name of the main program, as string.
     """
+    from pathlib import Path
+
     if getattr(sys, 'frozen', False):  # hasattr(sys, '_MEIPASS'):
         return Path(sys.executable).stem
     return Path(sys.modules['__main__'].__file__).stem
 
 
+# The decoded icon PhotoImage, shared by every window that sets it.
+_icon_image = None
+
+
 def set_icon(window) -> None:
     """
     Set the program icon image file.  If the icon cannot be displayed,
@@ -108,10 +144,16 @@ def set_icon(window) -> None:
     Args:  window: The main tk.Tk() window running the mainloop or a
         tk.Toplevel window.
     """
+    global _icon_image
+
     # The custom app icon is expected to be in the program's images folder.
+    # Decode the PNG only for the first window; later Toplevels reuse
+    #   the same PhotoImage.
     try:
-        icon = tk.PhotoImage(file=valid_path_to('images/helper_icon512.png'))
-        window.wm_iconphoto(True, icon)
+        if _icon_image is None:
+            _icon_image = tk.PhotoImage(
+                file=valid_path_to('images/helper_icon512.png'))
+        window.wm_iconphoto(True, _icon_image)
     except tk.TclError as err:
         print('Cannot display program icon, so it will be blank or the tk default.\n'
               f'tk error message: {err}')
@@ -120,15 +162,37 @@ def set_icon(window) -> None:
               'The program will run without a custom icon.')
 
 
-def manage_args() -> None:
-    """Allow handling of common command line arguments.
+@lru_cache(maxsize=1)
+def _get_parser():
     """
+    Build the command line parser on first use. argparse is imported
+    here, not at module top, so programs that never read the command
+    line skip its import cost entirely.
+
+    :return: The configured argparse.ArgumentParser.
+    """
+    import argparse
+
     parser = argparse.ArgumentParser()
     parser.add_argument('--about',
                         help='Provides description, version, GNU license',
                         action='store_true',
                         default=False)
-    args = parser.parse_args()
+    return parser
+
+
+@lru_cache(maxsize=1)
+def manage_args() -> None:
+    """Allow handling of common command line arguments.
+    Cached so startup paths that each call it only pay for one
+    ArgumentParser build and one walk of sys.argv per process.
+    """
+    # A bare launch has nothing to parse; skip the argparse import and
+    #   parser build entirely for the typical GUI start.
+    if len(sys.argv) == 1:
+        return
+
+    args = _get_parser().parse_args()
     if args.about:
         print(__doc__)
         print(f'{"Author:".ljust(13)}', __author__)
@@ -178,9 +242,36 @@ def position_wrt_window(window, offset_x=0, offset_y=0) -> str:
                      *window*.
     :return: x and y screen pixel coordinates as string, f'+{x}+{y}'
     """
-    coord_x = window.winfo_x() + offset_x
-    coord_y = window.winfo_y() + offset_y
-    return f'+{coord_x}+{coord_y}'
+    # %-formatting of two ints is a single C-level format call, a bit
+    #   cheaper than an f-string in motion-driven callbacks.
+    return '+%d+%d' % (window.winfo_x() + offset_x,
+                       window.winfo_y() + offset_y)
+
+
+# Pending after() ids for debounce(), keyed by the scheduling widget.
+_debounce_ids = {}
+
+
+def debounce(widget, callback, delay_ms: int = 16) -> None:
+    """
+    Coalesce a burst of repeated calls into a single deferred run of
+    *callback*. Tk collapses queued <Motion> events on its own, but
+    other rapid-fire callbacks (e.g., <Configure> repositioning during
+    a window drag) can flood the event loop; routing them through here
+    runs the callback at most once per *delay_ms*.
+    Example, in a drag handler:
+      utils.debounce(mytopwin, reposition_children)
+
+    :param widget: The tk widget used to schedule the deferred call;
+                   also keys the pending-call bookkeeping.
+    :param callback: The no-argument callable to run after the burst.
+    :param delay_ms: Quiet time, in milliseconds, before *callback*
+                     fires; each new call restarts the timer.
+    """
+    after_id = _debounce_ids.get(widget)
+    if after_id is not None:
+        widget.after_cancel(after_id)
+    _debounce_ids[widget] = widget.after(delay_ms, callback)
 
 
 def click(click_type: str, click_obj) -> None:
@@ -195,7 +286,11 @@ def click(click_type: str, click_obj) -> None:
                       be active.
     """
 
-    def on_click(event, command):
+    # The most recent click event, shared with the menu command lambdas
+    #   so the one cached Menu acts on whichever click posted it.
+    last_event = [None]
+
+    def on_click(command):
         """
         Sets menu command to the selected predefined virtual event.
         Event is a unifying binding across multiple platforms.
@@ -204,32 +299,48 @@ def click(click_type: str, click_obj) -> None:
         # Need to set possible Text widgets to be editable in case
         #   they are set to be readonly, tk.DISABLED.
         click_obj.configure(state=tk.NORMAL)
-        event.widget.event_generate(f'<<{command}>>')
+        last_event[0].widget.event_generate(f'<<{command}>>')
 
     # Based on: https://stackoverflow.com/questions/57701023/
-    def popup_menu(event):
-        right_click_menu = tk.Menu(None, tearoff=0, takefocus=0)
-
-        right_click_menu.add_command(
-            label='Select all',
-            command=lambda: on_click(event, 'SelectAll'))
-        right_click_menu.add_command(
-            label='Copy',
-            command=lambda: on_click(event, 'Copy'))
-        right_click_menu.add_command(
-            label='Paste',
-            command=lambda: on_click(event, 'Paste'))
-        right_click_menu.add_command(
-            label='Cut',
-            command=lambda: on_click(event, 'Cut'))
+    # Build the Menu lazily on the first click, then reuse it; creating
+    #   the menu and its commands on every click is five Tcl calls each time.
+    right_click_menu = None
 
+    def popup_menu(event):
+        nonlocal right_click_menu
+        if right_click_menu is None:
+            right_click_menu = tk.Menu(None, tearoff=0, takefocus=0)
+            for _label, _command in (('Select all', 'SelectAll'),
+                                     ('Copy', 'Copy'),
+                                     ('Paste', 'Paste'),
+                                     ('Cut', 'Cut')):
+                right_click_menu.add_command(
+                    label=_label,
+                    command=lambda cmd=_command: on_click(cmd))
+
+        last_event[0] = event
         right_click_menu.tk_popup(event.x_root + 10, event.y_root + 15)
 
     if click_type == 'right':
-        if MY_OS in 'lin, win':
-            click_obj.bind('<Button-3>', popup_menu)
-        elif MY_OS == 'dar':
-            click_obj.bind('<Button-2>', popup_menu)
+        click_obj.bind(_RIGHT_CLICK_BUTTON, popup_menu)
+
+
+def _focused_toplevel(mainwin):
+    """
+    Find the toplevel window that contains the focused widget.
+    Internal helper for get_toplevel().
+
+    :param mainwin: The main window object of the tk() mainloop.
+    :return: The Toplevel holding focus, *mainwin* when focus is in the
+             main window itself, or None when nothing has focus.
+    """
+    # Tk already tracks each widget's containing toplevel, so one
+    #   winfo_toplevel() call replaces walking the master chain (and,
+    #   before that, string-matching window paths against every child).
+    focus = mainwin.focus_get()
+    if focus is None:
+        return None
+    return focus.winfo_toplevel()
 
 
 def get_toplevel(action: str, mainwin):
@@ -249,47 +360,13 @@ def get_toplevel(action: str, mainwin):
              For *action* 'winpath', returns the tk window path
              name for the parent toplevel window.
     """
-    # Based on https://stackoverflow.com/questions/66384144/
-    # Need to cover all cases when the focus is on any toplevel window,
-    #  or on a child of that window path, i.e. '.!text' or '.!frame'.
-    # There may be many children in *mainwin* and any target toplevel
-    #   window will likely be listed at or toward the end, so read
-    #   children list in reverse.
     if action == 'position':
-        coordinates = None
-        for child in reversed(mainwin.winfo_children()):
-            if child == child.focus_get():
-                coordinates = position_wrt_window(window=child,
-                                                  offset_x=30,
-                                                  offset_y=20)
-            elif '.!text' in str(child.focus_get()):
-                parent = str(child.focus_get())[:-6]
-                if parent in str(child):
-                    coordinates = position_wrt_window(child, 30, 20)
-            elif '.!frame' in str(child.focus_get()):
-                parent = str(child.focus_get())[:-7]
-                if parent in str(child):
-                    coordinates = position_wrt_window(child, 30, 20)
-            elif str(child.focus_get()) == '.':
-                coordinates = position_wrt_window(mainwin, 30, 20)
-        return coordinates
+        target = _focused_toplevel(mainwin)
+        return position_wrt_window(target, 30, 20) if target is not None else None
     if action == 'winpath':
-        relative_path = mainwin.winfo_children()[-1]
-        for child in reversed(mainwin.winfo_children()):
-            if child == child.focus_get():
-                relative_path = child
-            elif '.!text' in str(child.focus_get()):
-                parent = str(child.focus_get())[:-6]
-                if parent in str(child):
-                    relative_path = child
-            elif '.!frame' in str(child.focus_get()):
-                parent = str(child.focus_get())[:-7]
-                if parent in str(child):
-                    relative_path = child
-            elif str(child.focus_get()) == '.':
-                relative_path = mainwin
-        return relative_path
-    # return None
+        target = _focused_toplevel(mainwin)
+        return target if target is not None else mainwin.winfo_children()[-1]
+    return None
 
 
 def keybind(func: str, toplevel, mainwin=None) -> None:
@@ -313,17 +390,33 @@ def keybind(func: str, toplevel, mainwin=None) -> None:
         root', 'main', or 'app'. Used only as a pass-through parameter
         when calling other utils functions.
     """
-    cmd_key = 'Command' if MY_OS == 'dar' else 'Control'  # is 'lin' or 'win'
+    binding = _KEYBIND_ACTIONS.get(func)
+    if binding is not None:
+        binding(toplevel, mainwin)
+
 
-    if func == 'close':
-        toplevel.bind(
-            f'<{f"{cmd_key}"}-w>',
-            lambda _: get_toplevel('winpath', mainwin).destroy())
-    if func == 'quit':
-        toplevel.bind(f'<{f"{cmd_key}"}-q>', lambda _: quit_gui(mainwin))
+def _bind_close(toplevel, mainwin) -> None:
+    """Bind the OS-specific close-window key to *toplevel*."""
+    toplevel.bind(
+        _CLOSE_SEQUENCE,
+        lambda _: get_toplevel('winpath', mainwin).destroy())
 
 
-def valid_path_to(relative_path: str) -> Path:
+def _bind_quit(toplevel, mainwin) -> None:
+    """Bind the OS-specific quit-program key to *toplevel*."""
+    toplevel.bind(_QUIT_SEQUENCE, lambda _: quit_gui(mainwin))
+
+
+# Dispatch table for keybind(); a dict lookup replaces a chain of
+#   func-name comparisons and keeps the actions in one place.
+_KEYBIND_ACTIONS = {
+    'close': _bind_close,
+    'quit': _bind_quit,
+}
+
+
+@lru_cache(maxsize=None)
+def valid_path_to(relative_path: str) -> 'Path':
     """
     Get correct path to program's directory/file structure
     depending on whether program invocation is a standalone app or
@@ -331,12 +424,19 @@ def valid_path_to(relative_path: str) -> Path:
     using any path; does not need to be from parent directory.
     _MEIPASS var is used by distribution programs from
     PyInstaller --onefile; e.g. for images dir.
+    Results are cached; the resolved base never changes at runtime
+    and resolve() stats the filesystem on every uncached call.
 
     :param relative_path: Program's local dir/file name, as string.
     :return: Absolute path as pathlib Path object.
     """
     # Modified from: https://stackoverflow.com/questions/7674790/
     #    bundling-data-files-with-pyinstaller-onefile and PyInstaller manual.
+    # pathlib is imported here, as in program_name(), so consumers of
+    #   the click/keybind helpers never pay for it; both functions are
+    #   cached, so the local import runs once per distinct call.
+    from pathlib import Path
+
     if getattr(sys, 'frozen', False):  # hasattr(sys, '_MEIPASS'):
         base_path = getattr(sys, '_MEIPASS', Path(Path(__file__).resolve()).parent)
         valid_path = Path(base_path) / relative_path
@@ -12,8 +12,8 @@ https://stackoverflow.com/questions/27262580/tkinter-binding-mouse-double-click
    Bruno Vermeulen's answer.
 """
 
-import sys
 from tk_utils import vcheck
+from tk_utils.constants import MY_OS
 
 vcheck.minversion('3.7')
 
@@ -26,6 +26,11 @@ except (ImportError, ModuleNotFoundError):
           '\nOn Linux, you may also need: $ sudo apt-get install python3-tk\n'
           'See also: https://tkdocs.com/tutorial/install.html\n')
 
+# Platform-dependent constants, resolved once at import instead of in
+#   per-instance (or per-cell) sys.platform checks.
+_RIGHT_CLICK = '<Button-2>' if MY_OS == 'dar' else '<Button-3>'  # macOS button 2.
+_DEFAULT_BG = 'white' if MY_OS == 'dar' else 'gray86'  # OS default widget bg.
+
 
 class WidgetTable(tk.Frame):
     """
@@ -35,6 +40,21 @@ class WidgetTable(tk.Frame):
     any number of columns and rows. Frame contents are proportionally
     resizable with window; self.master is the implicit parent.
     """
+
+    # Widgets' colors; class attributes because they are invariant and
+    #   shared by all instances (a subclass can simply override them).
+    theme = 'khaki'  # Used for outer frame border and header fg.
+    frame_bg = 'khaki3'  # Used for inner frame border and mouseover.
+    header_bg = 'firebrick'
+    hilite_bg = 'khaki4'  # Darker off-focus color of outer border.
+    label_bg1 = 'blue2'
+    label_bg2 = 'goldenrod'
+    # The default_bg tkinter widget background color varies with operating system.
+    default_bg = _DEFAULT_BG
+    label_fg1 = 'MediumPurple2'
+    # Have the alternate fg match the bg so it "disappears", except on mouseover.
+    label_fg2 = _DEFAULT_BG
+
     def __init__(self, columns: int, rows: int):
         super().__init__()
 
@@ -42,32 +62,43 @@ class WidgetTable(tk.Frame):
         self.columns = columns
         self.rows = rows
 
-        # Widgets' colors.
-        self.theme = 'khaki'  # Used for outer frame border and header fg.
-        self.frame_bg = 'khaki3'  # Used for inner frame border and mouseover.
-        self.header_bg = 'firebrick'
-        self.hilite_bg = 'khaki4' # Darker off-focus color of outer border.
-        self.label_bg1 = 'blue2'
-        self.label_bg2 = 'goldenrod'
-        # The default_bg tkinter widget background color varies with operating system.
-        self.default_bg = 'gray86'  # Linux and Windows default widget bg.
-        if sys.platform == 'darwin':  # macOS
-            self.default_bg = 'white'
-        self.label_fg1 = 'MediumPurple2'
-        # Have the alternate fg match the bg so it "disappears", except on mouseover.
-        self.label_fg2 = self.default_bg
-
-        self.double_click_flag = False
+        # Pending single-click timers, keyed by cell, so a double-click
+        #   can cancel its cell's delayed single-click action.
+        self.click_after_ids = {}
+
+        # Unique bindtag shared by this table's cells, so one class
+        #   binding per event type serves every cell; id() keeps
+        #   multiple WidgetTable instances from cross-firing.
+        self.cell_tag = f'WTCell{id(self)}'
+
+        # Table-driven color transitions for the hover and right-click
+        #   handlers: current bg -> next bg, with the handler's default
+        #   covering everything not mapped. Click-colored cells map to
+        #   themselves on enter, so hovering them never repaints.
+        self.enter_bg = {self.label_bg1: self.label_bg1,
+                         self.label_bg2: self.label_bg2}
+        self.leave_bg = {self.frame_bg: self.default_bg}
+        self.decolor_bg = {self.label_bg1: self.default_bg,
+                           self.label_bg2: self.default_bg}
+
+        # Click toggles in the same table-driven style: only the first
+        #   click color maps onward; any other current color (default,
+        #   mouseover, or decolored) starts the cycle at color 1.
+        self.click_bg = {self.label_bg1: self.label_bg2}
+        self.click_fg = {self.label_fg1: self.label_fg2}
 
         self.draw_table()
 
     def draw_table(self) -> None:
         """
-        Fill in the frame with contiguous Labels and bind fg and bg
-        color change functions to each. Number of columns and rows of
+        Configure the frame, bindings, and header, then fill in the
+        table of contiguous Labels. Number of columns and rows of
         widgets are specified in WidgetTable() call parameters. Labels
         are used here, but can also use Buttons; just need to modify for
         kw activebackground and command functions.
+        Cells are created in batches scheduled through after_idle() so
+        a large table fills in while the window stays responsive; for
+        the default 15 x 10 table this completes in a couple of passes.
         """
         # Note: self.master refers to the tk.Frame.
         # Allow the frame to fill the root window and resize with it.
@@ -82,51 +113,29 @@ class WidgetTable(tk.Frame):
             highlightbackground=self.hilite_bg,  # Darker color of outer border off focus.
         )
 
-        col_indx = 0
-        row_indx = 1  # row[0] is reserved for table header.
-        num_cells = self.columns * self.rows
-        labels = []
         event_handlers = {
             '<Button-1>': self.single_click,
             '<Double-1>': self.double_click,
             '<Shift-1>': self.shift_click,
             '<Enter>': self.on_enter,
             '<Leave>': self.on_leave,
-            '<Button-2>' if sys.platform == 'darwin' else '<Button-3>': self.decolor
+            _RIGHT_CLICK: self.decolor
         }
 
-        for i in range(num_cells):
-            label_text = str(i + 1).rjust(3)
-            label = tk.Label(text=label_text,
-                             fg=self.label_fg1,
-                             font='TkFixedFont',
-                             )
-            labels.append((label, row_indx, col_indx))
-
-            # Bind events to label using a dispatch dictionary of handlers.
-            for event, handler in event_handlers.items():
-                label.bind(event, lambda e, h=handler, l=label: h(l))
-
-            # Use this to sort cell numbers (text) vertically, by column.
-            #   Once a column has all rows gridded, move left to next column.
-            # row_indx += 1
-            # if row_indx > self.rows:
-            #     col_indx += 1
-            #     row_indx = 1
-
-            # Use this to sort cell numbers horizontally, by row.
-            #   Once a row has all columns gridded, move down to next row.
-            col_indx += 1
-            if col_indx > self.columns - 1:
-                row_indx += 1
-                col_indx = 0
+        # Bind each bound method once at class-tag level; handlers read
+        #   the cell from event.widget. This replaces columns x rows x
+        #   events individual bind() calls and their lambda closures.
+        for event, handler in event_handlers.items():
+            self.bind_class(self.cell_tag, event, handler)
 
         # Needed for proportional resizing of Frame contents upon window resize.
-        for _col in range(self.columns):
-            self.master.columnconfigure(_col, weight=1)
-
-        for _row in range(self.rows + 1):
-            self.master.rowconfigure(_row, weight=1)
+        # Tk 8.5+ grid configure commands take a list of indices, so
+        #   all weights are set in two Tcl calls total.
+        master = str(self.master)
+        self.tk.call('grid', 'columnconfigure', master,
+                     tuple(range(self.columns)), '-weight', 1)
+        self.tk.call('grid', 'rowconfigure', master,
+                     tuple(range(self.rows + 1)), '-weight', 1)
 
         header = tk.Label(text='Click colors a cell, again recolors,'
                                ' rt-click removes color,\n'
@@ -136,123 +145,193 @@ class WidgetTable(tk.Frame):
                           bg=self.header_bg)
         header.grid(column=0, row=0, columnspan=self.columns, sticky=tk.NSEW)
 
-        # Grid all table labels from the loop.
-        for label, row, col in labels:
-            label.grid(row=row, column=col, sticky=tk.NSEW)
+        filler = self.fill_cells()
+        self.after_idle(self.fill_chunk, filler)
+
+    def fill_chunk(self, filler) -> None:
+        """
+        Advance the cell builder by one batch, then reschedule itself
+        until the table is complete.
+        Called from draw_table().
+
+        :param filler: The running fill_cells() generator.
+        :return: None
+        """
+        try:
+            next(filler)
+        except StopIteration:
+            return
+        self.after_idle(self.fill_chunk, filler)
+
+    def fill_cells(self):
+        """
+        A generator that creates, tags, and grids the table cells,
+        yielding control back to the mainloop after each batch so
+        arbitrarily large tables build without freezing the window.
+        Cost scales with cells actually created per pass, not with the
+        full columns x rows count up front.
+        """
+        num_cells = self.columns * self.rows
+        chunk_size = 100
+        columns = self.columns
+        default_bg = self.default_bg
+        labels = []
+
+        # Pre-render every cell's text in one C-level comprehension
+        #   instead of a str().rjust() pair inside the hot loop.
+        texts = [str(n).rjust(3) for n in range(1, num_cells + 1)]
 
-    def on_enter(self, cell: tk) -> None:
+        for i in range(num_cells):
+            # divmod() sorts cell numbers (text) horizontally, by row;
+            #   row[0] is reserved for the table header. To sort
+            #   vertically by column instead, use
+            #   col_indx, row_offset = divmod(i, self.rows).
+            row_offset, col_indx = divmod(i, columns)
+            row_indx = row_offset + 1
+
+            # Passing bg here pins the starting color the handlers
+            #   expect, with no separate configure call per cell.
+            label = tk.Label(text=texts[i],
+                             fg=self.label_fg1,
+                             bg=default_bg,
+                             font='TkFixedFont',
+                             )
+            # Mirror the cell's bg and fg in Python attributes so event
+            #   handlers can read them without a Tcl cget round-trip;
+            #   cache the Tcl path name for their raw tk.call updates.
+            label.current_bg = default_bg
+            label.current_fg = self.label_fg1
+            label.tcl_path = str(label)
+            labels.append((label, row_indx, col_indx))
+
+            # Prepend the shared tag; the class-level bindings from
+            #   draw_table() then cover this cell.
+            label.bindtags((self.cell_tag,) + label.bindtags())
+
+            # Grid the finished batch, then hand control back to the
+            #   mainloop so pending events and redraws can run.
+            if len(labels) >= chunk_size:
+                self.grid_cells(labels)
+                labels.clear()
+                yield
+
+        # Grid any remainder cells after the loop.
+        self.grid_cells(labels)
+
+    def grid_cells(self, labels: list) -> None:
+        """
+        Grid a batch of cell labels with a single Tcl script; one
+        bridge crossing instead of a grid() call per cell, and geometry
+        is recomputed once for the whole batch.
+        Called from fill_cells().
+
+        :param labels: List of (label, row, column) tuples to grid.
+        :return: None
+        """
+        if labels:
+            self.tk.eval('\n'.join(
+                f'grid configure {label} -row {row} -column {col} -sticky nsew'
+                for label, row, col in labels))
+
+    def on_enter(self, event: tk.Event) -> None:
         """
         Indicate mouseover cells with a color() change
         (if different from default_bg bg).
 
-        :param cell: The active tkinter widget.
+        :param event: The <Enter> event; event.widget is the cell.
         :return: None
         """
+        cell = event.widget
 
-        # Use this to not have mouseover change color (mouseover = default bg).
-        # entered_color = cell['bg']
-        # if cell['bg'] == entered_color:
-        #     cell['bg'] = entered_color
-
-        # Use this to change cell color with mouseover.
-        if cell['bg'] == self.label_bg1:
-            cell['bg'] = self.label_bg1
-        elif cell['bg'] == self.label_bg2:
-            cell['bg'] = self.label_bg2
-        else:
-            cell['bg'] = self.frame_bg
+        # One transition-table lookup, and a Tcl configure call only
+        #   when the color actually changes.
+        new_bg = self.enter_bg.get(cell.current_bg, self.frame_bg)
+        if new_bg != cell.current_bg:
+            cell.current_bg = new_bg
+            self.tk.call(cell.tcl_path, 'configure', '-bg', new_bg)
 
-    def on_leave(self, cell: tk) -> None:
+    def on_leave(self, event: tk.Event) -> None:
         """
         On mouse leave, cell returns to entry color.
 
-        :param cell: The active tkinter widget.
+        :param event: The <Leave> event; event.widget is the cell.
         :return: None
         """
-        entered_color = cell['bg']
-        if cell['bg'] == self.frame_bg:
-            cell['bg'] = self.default_bg
-        else:
-            cell['bg'] = entered_color
-
-        # Use this statement instead to color in cursor path with the
-        #   mouseover color (when mouseover color is different from default_bg bg).
-        # if cell['bg'] == entered_color:
-        #     cell['bg'] = entered_color
-
-    def single_click(self, cell: tk) -> None:
+        cell = event.widget
+        new_bg = self.leave_bg.get(cell.current_bg, cell.current_bg)
+        if new_bg != cell.current_bg:
+            cell.current_bg = new_bg
+            self.tk.call(cell.tcl_path, 'configure', '-bg', new_bg)
+
+    def single_click(self, event: tk.Event) -> None:
         """
-        Delay a single click on the cell to allow double_click action.
+        Delay a single click on the cell so a double-click can cancel
+        it through its stored after() id.
         Binding to a mouse click event.
 
-        :param cell: The active tkinter widget, a passthrough parameter.
+        :param event: The <Button-1> event; event.widget is the cell.
         :return: None
         """
-        self.double_click_flag = False
-        self.after(300, self.click_control, cell)
+        cell = event.widget
+        self.click_after_ids[cell] = self.after(300, self.click_control, cell)
 
-    def double_click(self, event) -> None:
+    def double_click(self, event: tk.Event) -> None:
         """
-        Set flag to permit a double click event to change foreground in
-        click_control().
+        Cancel the cell's pending single-click action, then change its
+        foreground immediately; change it back on the next double-click.
+        When the cell's fg is set to the default_bg color, the cell's
+        text will blend into the default bg on alternate double-clicks.
         Binding to a mouse double-click event.
 
-        :param event: Any general mouse event.
+        :param event: The <Double-1> event; event.widget is the cell.
         :return: None
         """
-        self.double_click_flag = True
-        return event
+        after_id = self.click_after_ids.pop(event.widget, None)
+        if after_id is not None:
+            self.after_cancel(after_id)
+        self.shift_click(event)
 
     def click_control(self, cell: tk) -> None:
         """
-        Separate single and double mouse button events such that a
-        double-click will not call a single-click function.
-        Click a table cell (widget) to color it; click it again to
-        change the cell's background color.
-        Double-click a table cell to change its foreground color.
-        Double-click again to change it back.
-        When the cell's fg is set to the default_bg color, the cell's
-        text will blend into the default bg on alternate double-clicks.
+        Apply the delayed single-click action: click a table cell
+        (widget) to color it; click it again to change the cell's
+        background color. Runs only when no double-click cancelled the
+        timer set in single_click().
 
         :param cell: The active tkinter widget.
         :return: None
         """
-        if self.double_click_flag:
-            if cell['fg'] == self.label_fg1:
-                cell['fg'] = self.label_fg2
-            else:
-                cell['fg'] = self.label_fg1
-            self.double_click_flag = False
-
-        else:  # Is single click.
-            if cell['bg'] == self.label_bg1:
-                cell['bg'] = self.label_bg2
-            else:
-                cell['bg'] = self.label_bg1
-
-    def shift_click(self, cell: tk) -> None:
+        self.click_after_ids.pop(cell, None)
+        new_bg = self.click_bg.get(cell.current_bg, self.label_bg1)
+        cell.current_bg = new_bg
+        self.tk.call(cell.tcl_path, 'configure', '-bg', new_bg)
+
+    def shift_click(self, event: tk.Event) -> None:
         """
-        Toggles foreground color of *cell*.
+        Toggles foreground color of the clicked cell.
         Binding to a shift-click event.
 
-        :param cell: The active tkinter widget.
+        :param event: The <Shift-1> event; event.widget is the cell.
         :return: None
         """
-        if cell['fg'] == self.label_fg1:
-            cell['fg'] = self.label_fg2
-        else:
-            cell['fg'] = self.label_fg1
+        cell = event.widget
+        new_fg = self.click_fg.get(cell.current_fg, self.label_fg1)
+        cell.current_fg = new_fg
+        self.tk.call(cell.tcl_path, 'configure', '-fg', new_fg)
 
-    def decolor(self, cell: tk) -> None:
+    def decolor(self, event: tk.Event) -> None:
         """
-        Removes background color of *cell*.
+        Removes background color of the clicked cell.
         Binding to right-click event.
 
-        :param cell: The active tkinter widget.
+        :param event: The right-click event; event.widget is the cell.
         :return: None
         """
-        if cell['bg'] in (self.label_bg1, self.label_bg2):
-            cell['bg'] = self.default_bg
+        cell = event.widget
+        new_bg = self.decolor_bg.get(cell.current_bg, cell.current_bg)
+        if new_bg != cell.current_bg:
+            cell.current_bg = new_bg
+            self.tk.call(cell.tcl_path, 'configure', '-bg', new_bg)
 
 
 if __name__ == "__main__":